@@ -8,38 +8,247 @@ using Python and the Aptos SDK.
 """
 
 import asyncio
+import functools
 import json
+import os
 import time
-from typing import Dict, List, Optional, Tuple
-from aptos_sdk.client import RestClient
+import weakref
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+import aiohttp
+import httpx
+from aptos_sdk.client import ApiError, ClientConfig
 from aptos_sdk.account import Account
+from aptos_sdk.authenticator import Authenticator, Ed25519Authenticator
 from aptos_sdk.transactions import (
     EntryFunction,
+    ModuleId,
+    RawTransaction,
+    SignedTransaction,
     TransactionArgument,
     TransactionPayload,
     Serializer,
 )
 from aptos_sdk.type_tag import TypeTag, StructTag
 
+try:
+    import orjson
+except ImportError:
+    orjson = json  # same dumps/loads interface, just slower
+
+try:
+    import h2  # HTTP/2 backend for httpx (which aptos-sdk already depends on)
+except ImportError:
+    h2 = None
+
 # Configuration
 NODE_URL = "https://fullnode.testnet.aptoslabs.com"
 CONTRACT_ADDRESS = "0x9ba2d796ed64ea00a4f7690be844174820e0729de9f37fcaae429bc15ac37c04"
+BCS_CONTENT_TYPE = "application/x.aptos.signed_transaction+bcs"
+JSON_CONTENT_TYPE = "application/json"
+POOL_MAX_SIZE = int(os.environ.get("MODERNTENSOR_POOL_MAX_SIZE", "8"))
+USE_HTTP2 = os.environ.get("MODERNTENSOR_HTTP2") == "1"
+MODULE = f"{CONTRACT_ADDRESS}::moderntensor"
+
+
+class FN:
+    """Fully qualified view function ids, built once at import"""
+    NETWORK_STATS = f"{MODULE}::get_enhanced_network_stats"
+    FEE_INFO = f"{MODULE}::get_registration_fee_info"
+    TREASURY_STATS = f"{MODULE}::get_treasury_stats"
+    SUBNET_INFO = f"{MODULE}::get_subnet_info"
+    ALL_SUBNET_UIDS = f"{MODULE}::get_all_subnet_uids"
+    COIN_BALANCE = "0x1::coin::balance"
+
+
+_MODULE_ID = ModuleId.from_str(MODULE)
+
+# BCS serializers for each entry function's arguments, in call order
+_CREATE_SUBNET_SERS = (
+    Serializer.u64, Serializer.str, Serializer.str, Serializer.u64,
+    Serializer.u64, Serializer.u64, Serializer.u64, Serializer.bool,
+)
+_REGISTER_MINER_SERS = (
+    Serializer.to_bytes, Serializer.u64, Serializer.u64, Serializer.to_bytes, Serializer.to_bytes,
+)
+_REGISTER_VALIDATOR_SERS = (
+    Serializer.to_bytes, Serializer.u64, Serializer.u64, Serializer.u64,
+    Serializer.to_bytes, Serializer.to_bytes,
+)
+_PURCHASE_PERMIT_SERS = (Serializer.u64,)
+
+# Submission errors meaning the local sequence counter is out of sync
+_STALE_SEQUENCE_CODES = ("SEQUENCE_NUMBER_TOO_OLD", "SEQUENCE_NUMBER_TOO_NEW")
+
+
+def _as_bytes(value: Union[bytes, str]) -> bytes:
+    """Encode a string argument once, passing pre-encoded bytes through"""
+    return value if isinstance(value, bytes) else value.encode()
+
+
+def _as_text(value: Union[bytes, str]) -> str:
+    """Decode a possibly pre-encoded argument for display"""
+    return value.decode(errors="replace") if isinstance(value, bytes) else value
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_u64(value: int) -> bytes:
+    """BCS-encode a u64 argument; subnet ids and stakes repeat across a batch"""
+    return TransactionArgument(value, Serializer.u64).encode()
+
+
+class _SessionPool:
+    """
+    Bounded pool of keep-alive HTTP sessions shared by every client
+    
+    Sessions are opened on demand up to ``max_size`` and handed back after
+    each request, so bursts of calls reuse warm connections instead of
+    opening new sockets.
+    """
+    
+    def __init__(self, max_size: int):
+        self.max_size = max(1, max_size)
+        self._slots = asyncio.Semaphore(self.max_size)
+        self._idle: List[aiohttp.ClientSession] = []
+    
+    async def get(self) -> aiohttp.ClientSession:
+        """Check out a session, waiting for a free slot if the pool is exhausted"""
+        await self._slots.acquire()
+        while self._idle:
+            session = self._idle.pop()
+            if not session.closed:
+                return session
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=1, keepalive_timeout=75),
+            headers={"Connection": "keep-alive"},
+        )
+    
+    def put(self, session: aiohttp.ClientSession):
+        """Return a checked-out session to the pool"""
+        self._idle.append(session)
+        self._slots.release()
+    
+    async def recycle(self, session: aiohttp.ClientSession):
+        """Drop a broken session and free its slot for a fresh one"""
+        self._slots.release()
+        await session.close()
+    
+    async def close(self):
+        """Close every idle session"""
+        idle, self._idle = self._idle, []
+        for session in idle:
+            await session.close()
+
+
+_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SessionPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_pool() -> _SessionPool:
+    """Get the session pool bound to the running event loop, creating it once per loop"""
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.get(loop)
+    if pool is None:
+        pool = _POOLS[loop] = _SessionPool(POOL_MAX_SIZE)
+    return pool
+
+
+_HTTP2_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http2_client() -> httpx.AsyncClient:
+    """
+    Get the HTTP/2 client bound to the running event loop
+    
+    One multiplexed connection carries many concurrent requests, so this
+    needs far fewer sockets than the HTTP/1.1 session pool.
+    """
+    loop = asyncio.get_running_loop()
+    client = _HTTP2_CLIENTS.get(loop)
+    if client is None:
+        client = _HTTP2_CLIENTS[loop] = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=POOL_MAX_SIZE),
+                retries=1,
+            )
+        )
+    return client
+
+
+async def aclose_transports():
+    """Close the session pool and HTTP/2 client shared by all clients on this loop"""
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.pop(loop, None)
+    if pool is not None:
+        await pool.close()
+    http2_client = _HTTP2_CLIENTS.pop(loop, None)
+    if http2_client is not None:
+        await http2_client.aclose()
+
+
+class BatchCall(NamedTuple):
+    """
+    One view call in a ``ModernTensorClient.batch`` request
+    
+    When ``input_from`` is set it is the index of an earlier call in the
+    same batch, and ``arguments`` is a function that maps that call's
+    result to this call's argument list.
+    
+    With ``fan_out`` the (resolved) arguments are a list of argument lists
+    instead: the view runs once per entry, concurrently, and the slot's
+    result is the list of their results. This covers lookups whose count is
+    only known from an earlier result, e.g. info for every subnet id.
+    """
+    function: str
+    arguments: Union[List, Callable[[List], List]]
+    input_from: Optional[int] = None
+    type_arguments: Tuple = ()
+    fan_out: bool = False
+
 
 class ModernTensorClient:
     """
     Python client for interacting with the ModernTensor smart contract
     """
     
-    def __init__(self, private_key: Optional[str] = None):
+    def __init__(
+        self,
+        private_key: Optional[str] = None,
+        http2: bool = USE_HTTP2,
+        node_url: Optional[str] = None
+    ):
         """
         Initialize the client
         
         Args:
             private_key: Optional private key in hex format. If None, creates new account
+            http2: Send requests over a multiplexed HTTP/2 connection via httpx
+                instead of the HTTP/1.1 aiohttp session pool
+            node_url: Fullnode REST URL, without the ``/v1`` suffix. Defaults
+                to ``NODE_URL`` (testnet)
         """
-        self.client = RestClient(NODE_URL)
+        if http2 and h2 is None:
+            raise ImportError("HTTP/2 support requires: pip install 'httpx[http2]'")
+        self.http2 = http2
+        self.node_url = node_url or NODE_URL
+        self.client_config = ClientConfig()
         self.account = Account.load_key(private_key) if private_key else Account.generate()
         self.contract_address = CONTRACT_ADDRESS
+        self._chain_id: Optional[int] = None
+        self._seq: Optional[int] = None
+    
+    async def aclose(self):
+        """
+        Forget this client's cached sequence number and chain id
+        
+        The HTTP transports are shared by every client on the event loop and
+        stay open; call ``aclose_transports()`` once all clients are done.
+        """
+        self._seq = None
+        self._chain_id = None
     
     def get_address(self) -> str:
         """Get account address"""
@@ -49,11 +258,321 @@ class ModernTensorClient:
         """Get private key for backup"""
         return self.account.private_key.hex()
     
+    async def _request_http2(
+        self,
+        method: str,
+        path: str,
+        data: Optional[bytes] = None,
+        headers: Optional[Dict] = None
+    ):
+        """Send a request over the shared HTTP/2 connection"""
+        response = await get_http2_client().request(
+            method, f"{self.node_url}{path}", content=data, headers=headers
+        )
+        if response.status_code >= 400:
+            raise ApiError(response.text, response.status_code)
+        return orjson.loads(response.content)
+    
+    async def _request(self, method: str, path: str, **kwargs):
+        """Send a request through a pooled session, reopening a dropped connection once"""
+        if self.http2:
+            return await self._request_http2(method, path, **kwargs)
+        
+        pool = get_pool()
+        for attempt in range(2):
+            session = await pool.get()
+            recycled = False
+            try:
+                async with session.request(method, f"{self.node_url}{path}", **kwargs) as response:
+                    body = await response.read()
+                    if response.status >= 400:
+                        raise ApiError(body.decode(errors="replace"), response.status)
+                    return orjson.loads(body)
+            except aiohttp.ClientConnectionError:
+                recycled = True
+                await pool.recycle(session)
+                if attempt:
+                    raise
+            finally:
+                if not recycled:
+                    pool.put(session)
+    
+    async def _view(self, function: str, type_arguments: List, arguments: List) -> List:
+        """Call a view function over a pooled keep-alive session"""
+        return await self._request(
+            "POST",
+            "/v1/view",
+            data=orjson.dumps({
+                "function": function,
+                "type_arguments": type_arguments,
+                "arguments": arguments,
+            }),
+            headers={"Content-Type": JSON_CONTENT_TYPE},
+        )
+    
+    def _entry_function(self, function: str, args: Tuple, serializers: Tuple) -> EntryFunction:
+        """Build an entry function call, pairing each argument with its serializer"""
+        return EntryFunction(
+            _MODULE_ID,
+            function,
+            [],
+            [
+                _encode_u64(arg) if ser is Serializer.u64
+                else TransactionArgument(arg, ser).encode()
+                for arg, ser in zip(args, serializers)
+            ],
+        )
+    
+    async def _sequence_number(self) -> int:
+        """Fetch the account's current on-chain sequence number"""
+        data = await self._request("GET", f"/v1/accounts/{self.get_address()}")
+        return int(data["sequence_number"])
+    
+    async def _reserve_sequence_numbers(self, count: int) -> int:
+        """
+        Reserve ``count`` consecutive sequence numbers from the local counter
+        
+        The counter is fetched from the node on first use and after any
+        failed submission; otherwise no lookup is needed.
+        
+        Returns:
+            The first reserved sequence number
+        """
+        if self._seq is None:
+            fetched = await self._sequence_number()
+            if self._seq is None:
+                self._seq = fetched
+        first = self._seq
+        self._seq += count
+        return first
+    
+    async def _get_chain_id(self) -> int:
+        """Get the node's chain id, fetching it once per client"""
+        if self._chain_id is None:
+            info = await self._request("GET", "/v1")
+            self._chain_id = int(info["chain_id"])
+        return self._chain_id
+    
+    async def _sign_and_submit(self, payload: EntryFunction, sequence_number: int) -> str:
+        """Sign an entry function call with the given sequence number and submit it"""
+        raw_txn = RawTransaction(
+            self.account.address(),
+            sequence_number,
+            TransactionPayload(payload),
+            self.client_config.max_gas_amount,
+            self.client_config.gas_unit_price,
+            int(time.time()) + self.client_config.expiration_ttl,
+            await self._get_chain_id(),
+        )
+        authenticator = Authenticator(
+            Ed25519Authenticator(self.account.public_key(), self.account.sign(raw_txn.keyed()))
+        )
+        signed_txn = SignedTransaction(raw_txn, authenticator)
+        
+        try:
+            data = await self._request(
+                "POST",
+                "/v1/transactions",
+                data=signed_txn.bytes(),
+                headers={"Content-Type": BCS_CONTENT_TYPE},
+            )
+        except Exception:
+            # The local counter may now be ahead of the chain; resync next time
+            self._seq = None
+            raise
+        return data["hash"]
+    
+    async def _submit(
+        self,
+        payload: EntryFunction,
+        sequence_number: Optional[int] = None
+    ) -> str:
+        """
+        Sign an entry function call and submit it, returning the tx hash
+        
+        Args:
+            payload: Entry function to call
+            sequence_number: Explicit sequence number, used when several
+                transactions are submitted concurrently. Taken from the
+                local counter if None, refetching once if the node reports
+                it as too old or too new.
+        """
+        if sequence_number is not None:
+            return await self._sign_and_submit(payload, sequence_number)
+        
+        try:
+            return await self._sign_and_submit(payload, await self._reserve_sequence_numbers(1))
+        except ApiError as e:
+            if not any(code in str(e) for code in _STALE_SEQUENCE_CODES):
+                raise
+        # The failed submit cleared the counter, so this refetches it
+        return await self._sign_and_submit(payload, await self._reserve_sequence_numbers(1))
+    
+    async def _submit_all(self, submit, calls: List[Dict]) -> List[str]:
+        """
+        Submit independent transactions concurrently, then await them together
+        
+        A block of consecutive sequence numbers is reserved up front so the
+        parallel submissions never collide.
+        
+        Args:
+            submit: One of the ``_submit_*`` methods
+            calls: Keyword arguments for each ``submit`` call
+        """
+        sequence_number = await self._reserve_sequence_numbers(len(calls))
+        tx_hashes = await asyncio.gather(*(
+            submit(**kwargs, sequence_number=sequence_number + i)
+            for i, kwargs in enumerate(calls)
+        ))
+        await self.confirm_many(tx_hashes)
+        return list(tx_hashes)
+    
+    async def wait_for_tx(
+        self,
+        tx_hash: str,
+        initial: float = 0.1,
+        max_backoff: float = 2.0,
+        timeout: Optional[float] = None
+    ) -> Dict:
+        """
+        Poll a transaction until it is committed, backing off exponentially
+        
+        Args:
+            tx_hash: Hash returned by submission
+            initial: First polling interval in seconds
+            max_backoff: Upper bound for the polling interval
+            timeout: Seconds to wait before giving up. Defaults to the
+                client config's ``transaction_wait_in_seconds``
+            
+        Returns:
+            The committed transaction
+        """
+        if timeout is None:
+            timeout = self.client_config.transaction_wait_in_seconds
+        deadline = time.monotonic() + timeout
+        delay = initial
+        while True:
+            try:
+                txn = await self._request("GET", f"/v1/transactions/by_hash/{tx_hash}")
+            except ApiError as e:
+                if e.status_code != 404:
+                    raise
+                txn = None
+            
+            if txn is not None and txn["type"] != "pending_transaction":
+                if not txn.get("success"):
+                    raise RuntimeError(f"Transaction {tx_hash} failed: {txn.get('vm_status')}")
+                return txn
+            
+            if time.monotonic() + delay > deadline:
+                # A tx still pending will use its sequence number, so keep the
+                # counter; resync only once the node dropped it or it expired
+                if txn is None or time.time() > int(txn["expiration_timestamp_secs"]):
+                    self._seq = None
+                raise TimeoutError(f"Transaction {tx_hash} timed out")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_backoff)
+    
+    async def _await_tx(self, tx_hash: str):
+        """Wait until a submitted transaction is committed"""
+        await self.wait_for_tx(tx_hash)
+    
+    async def confirm_many(self, tx_hashes: List[str]) -> List[Dict]:
+        """
+        Wait for several submitted transactions to commit, concurrently
+        
+        Args:
+            tx_hashes: Hashes returned by calls made with ``confirm=False``
+            
+        Returns:
+            The committed transactions, in the same order as ``tx_hashes``
+        """
+        return list(await asyncio.gather(*(self.wait_for_tx(h) for h in tx_hashes)))
+    
+    async def batch(self, calls: List[BatchCall]) -> List[Any]:
+        """
+        Run dependent view calls layer by layer, each layer concurrently
+        
+        Calls without ``input_from`` form the first layer and every other
+        call runs one layer after the call it depends on, so a chain of
+        lookups costs one round-trip per layer rather than per call. A call
+        whose dependency failed is not sent; its slot gets an
+        INVALID_ARGUMENT ``ValueError`` instead.
+        
+        Example (stats and subnet ids, then every subnet's info: 2 round-trips):
+            stats, uids, infos = await client.batch([
+                BatchCall(FN.NETWORK_STATS, []),
+                BatchCall(FN.ALL_SUBNET_UIDS, []),
+                BatchCall(
+                    FN.SUBNET_INFO,
+                    lambda result: [[uid] for uid in result[0]],
+                    input_from=1,
+                    fan_out=True,
+                ),
+            ])
+        
+        Args:
+            calls: Calls to run; ``input_from`` must point at an earlier call
+            
+        Returns:
+            One entry per call: the view result, or the exception it raised.
+            A ``fan_out`` slot holds a list of these, one per sub-call.
+        """
+        layers: List[List[int]] = []
+        depths: List[int] = []
+        for i, call in enumerate(calls):
+            if call.input_from is None:
+                depth = 0
+            elif 0 <= call.input_from < i:
+                depth = depths[call.input_from] + 1
+            else:
+                raise ValueError(f"Batch call {i} has invalid input_from {call.input_from}")
+            if call.input_from is not None and not callable(call.arguments):
+                raise ValueError(
+                    f"Batch call {i} needs a function of call {call.input_from}'s result as arguments"
+                )
+            if call.input_from is None and callable(call.arguments):
+                raise ValueError(f"Batch call {i} has function arguments but no input_from")
+            depths.append(depth)
+            if depth == len(layers):
+                layers.append([])
+            layers[depth].append(i)
+        
+        results: List[Any] = [None] * len(calls)
+        
+        async def run(i: int):
+            call = calls[i]
+            try:
+                source: Any = None if call.input_from is None else results[call.input_from]
+                if isinstance(source, Exception):
+                    raise ValueError(
+                        f"INVALID_ARGUMENT: depends on failed call {call.input_from}"
+                    )
+                arguments = call.arguments(source) if callable(call.arguments) else call.arguments
+                type_arguments = list(call.type_arguments)
+                if call.fan_out:
+                    return list(await asyncio.gather(
+                        *(self._view(call.function, type_arguments, args) for args in arguments),
+                        return_exceptions=True,
+                    ))
+                return await self._view(call.function, type_arguments, arguments)
+            except Exception as e:
+                return e
+        
+        for layer in layers:
+            for i, result in zip(layer, await asyncio.gather(*(run(i) for i in layer))):
+                results[i] = result
+        return results
+    
     async def get_balance(self) -> int:
         """Get account APT balance"""
         try:
-            balance = self.client.account_balance(self.account.address())
-            return balance
+            result = await self._view(
+                FN.COIN_BALANCE,
+                ["0x1::aptos_coin::AptosCoin"],
+                [self.get_address()]
+            )
+            return int(result[0])
         except Exception as e:
             print(f"Error fetching balance: {e}")
             return 0
@@ -61,19 +580,21 @@ class ModernTensorClient:
     async def get_network_stats(self) -> Dict:
         """Get network statistics"""
         try:
-            result = self.client.view(
-                f"{self.contract_address}::moderntensor::get_enhanced_network_stats",
+            result = await self._view(
+                FN.NETWORK_STATS,
                 [],
                 []
             )
             
+            (total_validators, total_miners, total_subnets,
+             total_stake, active_validators, active_miners) = result
             return {
-                "total_validators": result[0],
-                "total_miners": result[1],
-                "total_subnets": result[2],
-                "total_stake": result[3],
-                "active_validators": result[4],
-                "active_miners": result[5]
+                "total_validators": total_validators,
+                "total_miners": total_miners,
+                "total_subnets": total_subnets,
+                "total_stake": total_stake,
+                "active_validators": active_validators,
+                "active_miners": active_miners
             }
         except Exception as e:
             print(f"Error fetching network stats: {e}")
@@ -82,17 +603,18 @@ class ModernTensorClient:
     async def get_fee_info(self) -> Dict:
         """Get fee information"""
         try:
-            result = self.client.view(
-                f"{self.contract_address}::moderntensor::get_registration_fee_info",
+            result = await self._view(
+                FN.FEE_INFO,
                 [],
                 []
             )
             
+            miner_fee, validator_fee, subnet_fee, permit_fee, *_ = result
             return {
-                "miner_fee": result[0],
-                "validator_fee": result[1],
-                "subnet_fee": result[2],
-                "permit_fee": result[3]
+                "miner_fee": miner_fee,
+                "validator_fee": validator_fee,
+                "subnet_fee": subnet_fee,
+                "permit_fee": permit_fee
             }
         except Exception as e:
             print(f"Error fetching fee info: {e}")
@@ -101,17 +623,18 @@ class ModernTensorClient:
     async def get_treasury_stats(self) -> Dict:
         """Get treasury statistics"""
         try:
-            result = self.client.view(
-                f"{self.contract_address}::moderntensor::get_treasury_stats",
+            result = await self._view(
+                FN.TREASURY_STATS,
                 [],
                 []
             )
             
+            total_burned, total_treasury_fees, total_registrations, total_permits, *_ = result
             return {
-                "total_burned": result[0],
-                "total_treasury_fees": result[1],
-                "total_registrations": result[2],
-                "total_permits": result[3]
+                "total_burned": total_burned,
+                "total_treasury_fees": total_treasury_fees,
+                "total_registrations": total_registrations,
+                "total_permits": total_permits
             }
         except Exception as e:
             print(f"Error fetching treasury stats: {e}")
@@ -120,25 +643,95 @@ class ModernTensorClient:
     async def get_subnet_info(self, subnet_id: int) -> Dict:
         """Get subnet information"""
         try:
-            result = self.client.view(
-                f"{self.contract_address}::moderntensor::get_subnet_info",
-                [subnet_id],
-                []
+            result = await self._view(
+                FN.SUBNET_INFO,
+                [],
+                [str(subnet_id)]
             )
             
+            # The view returns a single SubnetInfo struct
+            (info,) = result
             return {
-                "subnet_id": result[0],
-                "name": result[1],
-                "description": result[2],
-                "max_validators": result[3],
-                "max_miners": result[4],
-                "current_validators": result[5],
-                "current_miners": result[6]
+                "subnet_id": info["subnet_uid"],
+                "name": info["name"],
+                "description": info["description"],
+                "max_validators": info["max_validators"],
+                "max_miners": info["max_miners"],
+                "current_validators": info["validator_count"],
+                "current_miners": info["miner_count"]
             }
         except Exception as e:
             print(f"Error fetching subnet info: {e}")
             raise
     
+    async def _submit_create_subnet(
+        self,
+        subnet_id: int,
+        name: str,
+        description: str,
+        max_validators: int,
+        max_miners: int,
+        min_stake_validator: int,
+        min_stake_miner: int,
+        permits_required: bool = False,
+        sequence_number: Optional[int] = None
+    ) -> str:
+        """Submit a create_subnet transaction without waiting for it"""
+        payload = self._entry_function(
+            "create_subnet",
+            (subnet_id, name, description, max_validators, max_miners,
+             min_stake_validator, min_stake_miner, permits_required),
+            _CREATE_SUBNET_SERS
+        )
+        return await self._submit(payload, sequence_number)
+    
+    async def _submit_register_miner(
+        self,
+        uid: Union[bytes, str],
+        subnet_id: int,
+        stake: int,
+        wallet_hash: Union[bytes, str],
+        api_endpoint: Union[bytes, str],
+        sequence_number: Optional[int] = None
+    ) -> str:
+        """Submit a register_miner transaction without waiting for it"""
+        payload = self._entry_function(
+            "register_miner",
+            (_as_bytes(uid), subnet_id, stake, _as_bytes(wallet_hash), _as_bytes(api_endpoint)),
+            _REGISTER_MINER_SERS
+        )
+        return await self._submit(payload, sequence_number)
+    
+    async def _submit_register_validator(
+        self,
+        uid: Union[bytes, str],
+        subnet_id: int,
+        stake: int,
+        bond: int,
+        wallet_hash: Union[bytes, str],
+        api_endpoint: Union[bytes, str],
+        sequence_number: Optional[int] = None
+    ) -> str:
+        """Submit a register_validator transaction without waiting for it"""
+        payload = self._entry_function(
+            "register_validator",
+            (_as_bytes(uid), subnet_id, stake, bond,
+             _as_bytes(wallet_hash), _as_bytes(api_endpoint)),
+            _REGISTER_VALIDATOR_SERS
+        )
+        return await self._submit(payload, sequence_number)
+    
+    async def _submit_purchase_validator_permit(
+        self,
+        subnet_id: int,
+        sequence_number: Optional[int] = None
+    ) -> str:
+        """Submit a purchase_validator_permit transaction without waiting for it"""
+        payload = self._entry_function(
+            "purchase_validator_permit", (subnet_id,), _PURCHASE_PERMIT_SERS
+        )
+        return await self._submit(payload, sequence_number)
+    
     async def create_subnet(
         self,
         subnet_id: int,
@@ -152,28 +745,11 @@ class ModernTensorClient:
     ) -> str:
         """Create a new subnet"""
         try:
-            payload = EntryFunction.natural(
-                f"{self.contract_address}::moderntensor",
-                "create_subnet",
-                [],
-                [
-                    TransactionArgument(subnet_id, Serializer.u64),
-                    TransactionArgument(name, Serializer.str),
-                    TransactionArgument(description, Serializer.str),
-                    TransactionArgument(max_validators, Serializer.u64),
-                    TransactionArgument(max_miners, Serializer.u64),
-                    TransactionArgument(min_stake_validator, Serializer.u64),
-                    TransactionArgument(min_stake_miner, Serializer.u64),
-                    TransactionArgument(permits_required, Serializer.bool),
-                ]
-            )
-            
-            signed_txn = self.client.create_bcs_signed_transaction(
-                self.account, TransactionPayload(payload)
+            tx_hash = await self._submit_create_subnet(
+                subnet_id, name, description, max_validators, max_miners,
+                min_stake_validator, min_stake_miner, permits_required
             )
-            
-            tx_hash = self.client.submit_bcs_transaction(signed_txn)
-            self.client.wait_for_transaction(tx_hash)
+            await self._await_tx(tx_hash)
             
             print(f"✅ Subnet {subnet_id} created successfully")
             return tx_hash
@@ -184,35 +760,33 @@ class ModernTensorClient:
     
     async def register_miner(
         self,
-        uid: str,
+        uid: Union[bytes, str],
         subnet_id: int,
         stake: int,
-        wallet_hash: str,
-        api_endpoint: str
+        wallet_hash: Union[bytes, str],
+        api_endpoint: Union[bytes, str],
+        confirm: bool = True
     ) -> str:
-        """Register as a miner"""
+        """
+        Register as a miner
+        
+        Args:
+            uid, wallet_hash, api_endpoint: Strings, or bytes already encoded
+                by the caller (saves re-encoding in bulk registration loops)
+            confirm: Wait for the transaction to commit. If False, return the
+                hash right after submission and confirm later with
+                ``confirm_many``.
+        """
         try:
-            payload = EntryFunction.natural(
-                f"{self.contract_address}::moderntensor",
-                "register_miner",
-                [],
-                [
-                    TransactionArgument(uid.encode(), Serializer.bytes),
-                    TransactionArgument(subnet_id, Serializer.u64),
-                    TransactionArgument(stake, Serializer.u64),
-                    TransactionArgument(wallet_hash.encode(), Serializer.bytes),
-                    TransactionArgument(api_endpoint.encode(), Serializer.bytes),
-                ]
+            tx_hash = await self._submit_register_miner(
+                uid, subnet_id, stake, wallet_hash, api_endpoint
             )
+            if not confirm:
+                print(f"📤 Miner {_as_text(uid)} registration submitted")
+                return tx_hash
+            await self._await_tx(tx_hash)
             
-            signed_txn = self.client.create_bcs_signed_transaction(
-                self.account, TransactionPayload(payload)
-            )
-            
-            tx_hash = self.client.submit_bcs_transaction(signed_txn)
-            self.client.wait_for_transaction(tx_hash)
-            
-            print(f"✅ Miner {uid} registered successfully")
+            print(f"✅ Miner {_as_text(uid)} registered successfully")
             return tx_hash
             
         except Exception as e:
@@ -221,59 +795,55 @@ class ModernTensorClient:
     
     async def register_validator(
         self,
-        uid: str,
+        uid: Union[bytes, str],
         subnet_id: int,
         stake: int,
         bond: int,
-        wallet_hash: str,
-        api_endpoint: str
+        wallet_hash: Union[bytes, str],
+        api_endpoint: Union[bytes, str],
+        confirm: bool = True
     ) -> str:
-        """Register as a validator"""
+        """
+        Register as a validator
+        
+        Args:
+            uid, wallet_hash, api_endpoint: Strings, or bytes already encoded
+                by the caller (saves re-encoding in bulk registration loops)
+            confirm: Wait for the transaction to commit. If False, return the
+                hash right after submission and confirm later with
+                ``confirm_many``.
+        """
         try:
-            payload = EntryFunction.natural(
-                f"{self.contract_address}::moderntensor",
-                "register_validator",
-                [],
-                [
-                    TransactionArgument(uid.encode(), Serializer.bytes),
-                    TransactionArgument(subnet_id, Serializer.u64),
-                    TransactionArgument(stake, Serializer.u64),
-                    TransactionArgument(bond, Serializer.u64),
-                    TransactionArgument(wallet_hash.encode(), Serializer.bytes),
-                    TransactionArgument(api_endpoint.encode(), Serializer.bytes),
-                ]
-            )
-            
-            signed_txn = self.client.create_bcs_signed_transaction(
-                self.account, TransactionPayload(payload)
+            tx_hash = await self._submit_register_validator(
+                uid, subnet_id, stake, bond, wallet_hash, api_endpoint
             )
+            if not confirm:
+                print(f"📤 Validator {_as_text(uid)} registration submitted")
+                return tx_hash
+            await self._await_tx(tx_hash)
             
-            tx_hash = self.client.submit_bcs_transaction(signed_txn)
-            self.client.wait_for_transaction(tx_hash)
-            
-            print(f"✅ Validator {uid} registered successfully")
+            print(f"✅ Validator {_as_text(uid)} registered successfully")
             return tx_hash
             
         except Exception as e:
             print(f"❌ Error registering validator: {e}")
             raise
     
-    async def purchase_validator_permit(self, subnet_id: int) -> str:
-        """Purchase validator permit"""
+    async def purchase_validator_permit(self, subnet_id: int, confirm: bool = True) -> str:
+        """
+        Purchase validator permit
+        
+        Args:
+            confirm: Wait for the transaction to commit. If False, return the
+                hash right after submission and confirm later with
+                ``confirm_many``.
+        """
         try:
-            payload = EntryFunction.natural(
-                f"{self.contract_address}::moderntensor",
-                "purchase_validator_permit",
-                [],
-                [TransactionArgument(subnet_id, Serializer.u64)]
-            )
-            
-            signed_txn = self.client.create_bcs_signed_transaction(
-                self.account, TransactionPayload(payload)
-            )
-            
-            tx_hash = self.client.submit_bcs_transaction(signed_txn)
-            self.client.wait_for_transaction(tx_hash)
+            tx_hash = await self._submit_purchase_validator_permit(subnet_id)
+            if not confirm:
+                print(f"📤 Validator permit purchase submitted for subnet {subnet_id}")
+                return tx_hash
+            await self._await_tx(tx_hash)
             
             print(f"✅ Validator permit purchased for subnet {subnet_id}")
             return tx_hash
@@ -281,6 +851,60 @@ class ModernTensorClient:
         except Exception as e:
             print(f"❌ Error purchasing validator permit: {e}")
             raise
+    
+    async def batch_create_subnets(self, subnets: List[Dict]) -> List[str]:
+        """
+        Create several subnets concurrently
+        
+        Args:
+            subnets: List of create_subnet keyword arguments
+            
+        Returns:
+            Transaction hashes, in the same order as ``subnets``
+        """
+        try:
+            tx_hashes = await self._submit_all(self._submit_create_subnet, subnets)
+            print(f"✅ {len(tx_hashes)} subnets created successfully")
+            return tx_hashes
+        except Exception as e:
+            print(f"❌ Error creating subnets: {e}")
+            raise
+    
+    async def batch_register_miners(self, miners: List[Dict]) -> List[str]:
+        """
+        Register several miners concurrently
+        
+        Args:
+            miners: List of register_miner keyword arguments
+            
+        Returns:
+            Transaction hashes, in the same order as ``miners``
+        """
+        try:
+            tx_hashes = await self._submit_all(self._submit_register_miner, miners)
+            print(f"✅ {len(tx_hashes)} miners registered successfully")
+            return tx_hashes
+        except Exception as e:
+            print(f"❌ Error registering miners: {e}")
+            raise
+    
+    async def batch_register_validators(self, validators: List[Dict]) -> List[str]:
+        """
+        Register several validators concurrently
+        
+        Args:
+            validators: List of register_validator keyword arguments
+            
+        Returns:
+            Transaction hashes, in the same order as ``validators``
+        """
+        try:
+            tx_hashes = await self._submit_all(self._submit_register_validator, validators)
+            print(f"✅ {len(tx_hashes)} validators registered successfully")
+            return tx_hashes
+        except Exception as e:
+            print(f"❌ Error registering validators: {e}")
+            raise
 
 
 async def main():
@@ -295,9 +919,16 @@ async def main():
     print(f"🔑 Private Key: {client.get_private_key()}")
     
     try:
+        # Fetch all independent read-only data concurrently
+        stats, fee_info, treasury_stats, balance = await asyncio.gather(
+            client.get_network_stats(),
+            client.get_fee_info(),
+            client.get_treasury_stats(),
+            client.get_balance(),
+        )
+        
         # Get network stats
         print("\n📊 Network Statistics:")
-        stats = await client.get_network_stats()
         print(f"- Total Validators: {stats['total_validators']}")
         print(f"- Total Miners: {stats['total_miners']}")
         print(f"- Total Subnets: {stats['total_subnets']}")
@@ -305,7 +936,6 @@ async def main():
         
         # Get fee info
         print("\n💰 Fee Information:")
-        fee_info = await client.get_fee_info()
         print(f"- Miner Fee: {fee_info['miner_fee']} APT")
         print(f"- Validator Fee: {fee_info['validator_fee']} APT")
         print(f"- Subnet Fee: {fee_info['subnet_fee']} APT")
@@ -313,13 +943,11 @@ async def main():
         
         # Get treasury stats
         print("\n🏦 Treasury Statistics:")
-        treasury_stats = await client.get_treasury_stats()
         print(f"- Total Burned: {treasury_stats['total_burned']}")
         print(f"- Total Treasury Fees: {treasury_stats['total_treasury_fees']}")
         print(f"- Total Registrations: {treasury_stats['total_registrations']}")
         
         # Check balance
-        balance = await client.get_balance()
         print(f"\n💰 Account Balance: {balance} APT")
         
         if balance < 100000000:  # 1 APT
@@ -359,11 +987,32 @@ async def main():
         #     api_endpoint="http://python-validator.example.com"
         # )
         
+        # Buy permits for several subnets, then confirm them all at once
+        # permit_hashes = [
+        #     await client.purchase_validator_permit(subnet_id, confirm=False)
+        #     for subnet_id in (1, 2)
+        # ]
+        # await client.confirm_many(permit_hashes)
+        
+        # Register several miners at once (submitted together, confirmed together)
+        # await client.batch_register_miners([
+        #     {
+        #         "uid": f"python_miner_{i}",
+        #         "subnet_id": 1,
+        #         "stake": 10000000,
+        #         "wallet_hash": f"python_wallet_hash_{i}",
+        #         "api_endpoint": f"http://python-miner-{i}.example.com",
+        #     }
+        #     for i in range(2, 5)
+        # ])
+        
         print("\n🎉 Demo completed successfully!")
         print("💡 Uncomment the operations above to test transactions")
         
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        await aclose_transports()
 
 
 if __name__ == "__main__":
@@ -5,15 +5,49 @@ ModernTensor Quick Start Script
 
 This script provides a quick way to test the ModernTensor contract
 with all the basic operations in one go.
+
+Requires Python 3.11+ (asyncio.TaskGroup).
 """
 
-import subprocess
+import asyncio
+import os
 import sys
-import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "examples"))
+from python_client import ModernTensorClient, aclose_transports
 
 # Configuration
 CONTRACT_ADDRESS = "0x9ba2d796ed64ea00a4f7690be844174820e0729de9f37fcaae429bc15ac37c04"
 PROFILE = "default"
+APTOS_CONFIG = os.path.join(".aptos", "config.yaml")
+
+# Test identities (plain strings; the client BCS-encodes them)
+QUICK_SUBNET_ID = 999
+QUICK_SUBNET = {
+    "subnet_id": QUICK_SUBNET_ID,
+    "name": "Quick Start Subnet",
+    "description": "Test subnet created by quick start script",
+    "max_validators": 5,
+    "max_miners": 50,
+    "min_stake_validator": 1000000,
+    "min_stake_miner": 1000000,
+    "permits_required": False,
+}
+QUICK_MINER = {
+    "uid": "quick_miner_1",
+    "subnet_id": QUICK_SUBNET_ID,
+    "stake": 10000000,
+    "wallet_hash": "quick_miner_wallet",
+    "api_endpoint": "http://quick-miner.example.com",
+}
+QUICK_VALIDATOR = {
+    "uid": "quick_validator_1",
+    "subnet_id": QUICK_SUBNET_ID,
+    "stake": 50000000,
+    "bond": 10000000,
+    "wallet_hash": "quick_validator_wallet",
+    "api_endpoint": "http://quick-validator.example.com",
+}
 
 def print_header(text):
     """Print a formatted header"""
@@ -26,28 +60,60 @@ def print_step(step, description):
     print(f"\n{step}. {description}")
     print("-" * 30)
 
-def run_cmd(cmd, description=""):
-    """Run a command and show the result"""
+def load_profile(profile):
+    """Read a profile's settings from the Aptos CLI config"""
+    settings = {}
+    in_profile = False
+    with open(APTOS_CONFIG) as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped == f"{profile}:":
+                in_profile = True
+            elif in_profile and line.startswith("    ") and ":" in stripped:
+                key, value = stripped.split(":", 1)
+                settings[key] = value.strip().strip('"')
+            elif in_profile and stripped:
+                break
+    if "private_key" not in settings:
+        raise KeyError(f"No private key for profile '{profile}' in {APTOS_CONFIG}")
+    return settings
+
+def create_client(profile):
+    """Create a client for a CLI profile's account and node"""
+    settings = load_profile(profile)
+    node_url = settings.get("rest_url", "").rstrip("/")
+    if node_url.endswith("/v1"):
+        node_url = node_url[:-len("/v1")]
+    return ModernTensorClient(
+        settings["private_key"].replace("ed25519-priv-", ""),
+        node_url=node_url or None,
+    )
+
+async def capture(call):
+    """Await a client call, returning its exception instead of raising it"""
+    try:
+        return await call
+    except Exception as e:
+        return e
+
+def show_result(result, description=""):
+    """Show the outcome of a client call"""
     if description:
         print(f"🔄 {description}")
-    print(f"Running: {cmd}")
     
-    try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Success!")
-            if result.stdout:
-                print(result.stdout)
-        else:
-            print("❌ Failed!")
-            if result.stderr:
-                print(result.stderr)
-        return result.returncode == 0
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
+    if isinstance(result, Exception):
+        print("❌ Failed!")
+        print(result)
+        return None
+    print("✅ Success!")
+    print(result)
+    return result
+
+async def run_step(call, description=""):
+    """Await a client call and show the result"""
+    return show_result(await capture(call), description)
 
-def main():
+async def main_async():
     """Main quick start function"""
     print_header("MODERNTENSOR QUICK START")
     
@@ -62,76 +128,77 @@ def main():
     
     input("\nPress Enter to continue...")
     
+    try:
+        client = create_client(PROFILE)
+    except (OSError, KeyError) as e:
+        print(f"❌ Could not load Aptos profile '{PROFILE}': {e}")
+        print("💡 Please run 'python3 deploy.py' first")
+        sys.exit(1)
+    try:
+        await run_steps(client)
+    finally:
+        await aclose_transports()
+    
+    print_summary()
+
+async def run_steps(client):
+    """Run the quick start steps against the contract"""
     # Step 1: Check contract deployment
     print_step(1, "Checking contract deployment")
-    if not run_cmd(f"aptos move view --profile {PROFILE} --function-id {CONTRACT_ADDRESS}::moderntensor::get_enhanced_network_stats", "Checking if contract is deployed"):
+    if await run_step(client.get_network_stats(), "Checking if contract is deployed") is None:
         print("❌ Contract not deployed or not responding")
         print("💡 Please run 'python3 deploy.py' first")
         sys.exit(1)
     
+    # Steps 2-3 are independent reads; fetch them together, print in order
+    async with asyncio.TaskGroup() as tg:
+        stats = tg.create_task(capture(client.get_network_stats()))
+        fee_info = tg.create_task(capture(client.get_fee_info()))
+    
     # Step 2: Get network statistics
     print_step(2, "Getting network statistics")
-    run_cmd(f"aptos move view --profile {PROFILE} --function-id {CONTRACT_ADDRESS}::moderntensor::get_enhanced_network_stats", "Getting network stats")
+    show_result(stats.result(), "Getting network stats")
     
     # Step 3: Get fee information
     print_step(3, "Getting fee information")
-    run_cmd(f"aptos move view --profile {PROFILE} --function-id {CONTRACT_ADDRESS}::moderntensor::get_registration_fee_info", "Getting fee info")
+    show_result(fee_info.result(), "Getting fee info")
     
     # Step 4: Create a test subnet
     print_step(4, "Creating a test subnet")
-    subnet_cmd = f"""aptos move run --profile {PROFILE} --assume-yes \\
-        --function-id {CONTRACT_ADDRESS}::moderntensor::create_subnet \\
-        --args u64:999 \\
-        --args string:"Quick Start Subnet" \\
-        --args string:"Test subnet created by quick start script" \\
-        --args u64:5 \\
-        --args u64:50 \\
-        --args u64:1000000 \\
-        --args u64:1000000 \\
-        --args bool:false"""
-    
-    if run_cmd(subnet_cmd, "Creating test subnet"):
-        time.sleep(3)  # Wait for transaction confirmation
+    await run_step(client.create_subnet(**QUICK_SUBNET), "Creating test subnet")
+    
+    # Steps 5-6 both only need the subnet; submit and confirm them together
+    async with asyncio.TaskGroup() as tg:
+        miner = tg.create_task(capture(client.register_miner(**QUICK_MINER)))
+        validator = tg.create_task(capture(client.register_validator(**QUICK_VALIDATOR)))
     
     # Step 5: Register a miner
     print_step(5, "Registering a test miner")
-    miner_cmd = f"""aptos move run --profile {PROFILE} --assume-yes \\
-        --function-id {CONTRACT_ADDRESS}::moderntensor::register_miner \\
-        --args hex:"717569636b5f6d696e65725f31" \\
-        --args u64:999 \\
-        --args u64:10000000 \\
-        --args hex:"717569636b5f6d696e65725f77616c6c6574" \\
-        --args hex:"687474703a2f2f717569636b2d6d696e65722e6578616d706c652e636f6d" """
-    
-    if run_cmd(miner_cmd, "Registering test miner"):
-        time.sleep(3)  # Wait for transaction confirmation
+    show_result(miner.result(), "Registering test miner")
     
     # Step 6: Register a validator
     print_step(6, "Registering a test validator")
-    validator_cmd = f"""aptos move run --profile {PROFILE} --assume-yes \\
-        --function-id {CONTRACT_ADDRESS}::moderntensor::register_validator \\
-        --args hex:"717569636b5f76616c696461746f725f31" \\
-        --args u64:999 \\
-        --args u64:50000000 \\
-        --args u64:10000000 \\
-        --args hex:"717569636b5f76616c696461746f725f77616c6c6574" \\
-        --args hex:"687474703a2f2f717569636b2d76616c696461746f722e6578616d706c652e636f6d" """
-    
-    if run_cmd(validator_cmd, "Registering test validator"):
-        time.sleep(3)  # Wait for transaction confirmation
+    show_result(validator.result(), "Registering test validator")
     
     # Step 7: Show final statistics
+    async with asyncio.TaskGroup() as tg:
+        stats = tg.create_task(capture(client.get_network_stats()))
+        subnet_info = tg.create_task(capture(client.get_subnet_info(QUICK_SUBNET_ID)))
+        treasury_stats = tg.create_task(capture(client.get_treasury_stats()))
+    
     print_step(7, "Final network statistics")
-    run_cmd(f"aptos move view --profile {PROFILE} --function-id {CONTRACT_ADDRESS}::moderntensor::get_enhanced_network_stats", "Getting updated network stats")
+    show_result(stats.result(), "Getting updated network stats")
     
     # Get subnet info
     print("\n📊 Subnet Information:")
-    run_cmd(f"aptos move view --profile {PROFILE} --function-id {CONTRACT_ADDRESS}::moderntensor::get_subnet_info --args u64:999", "Getting subnet info")
+    show_result(subnet_info.result(), "Getting subnet info")
     
     # Get treasury stats
     print("\n🏦 Treasury Statistics:")
-    run_cmd(f"aptos move view --profile {PROFILE} --function-id {CONTRACT_ADDRESS}::moderntensor::get_treasury_stats", "Getting treasury stats")
-    
+    show_result(treasury_stats.result(), "Getting treasury stats")
+
+def print_summary():
+    """Print the completion summary and next steps"""
     # Success message
     print_header("QUICK START COMPLETED!")
     
@@ -173,4 +240,4 @@ def main():
     print("="*50)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main_async()) 
\ No newline at end of file
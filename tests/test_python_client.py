@@ -0,0 +1,290 @@
+"""
+Tests for the ModernTensor Python client's connection, batching and
+transaction bookkeeping logic. No network access is needed: requests go
+either to a refused local port or through a stubbed ``_request``.
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples"))
+import python_client as pc
+
+
+def _refused_url() -> str:
+    """URL of a local port that nothing is listening on"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def test_pool_waiters_fail_instead_of_hanging_on_refused_connection(monkeypatch):
+    monkeypatch.setattr(pc, "POOL_MAX_SIZE", 1)
+    monkeypatch.setattr(pc, "NODE_URL", _refused_url())
+    client = pc.ModernTensorClient()
+
+    async def run():
+        calls = [client._view(pc.FN.NETWORK_STATS, [], []) for _ in range(3)]
+        results = await asyncio.wait_for(
+            asyncio.gather(*calls, return_exceptions=True), timeout=10
+        )
+        await pc.aclose_transports()
+        return results
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, aiohttp.ClientConnectionError) for r in results)
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_client_aclose_keeps_shared_transports_open(monkeypatch, http2):
+    async def view(request):
+        await asyncio.sleep(0.05)
+        return web.json_response(["1"])
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/v1/view", view)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        monkeypatch.setattr(pc, "NODE_URL", f"http://127.0.0.1:{port}")
+
+        first = pc.ModernTensorClient(http2=http2)
+        second = pc.ModernTensorClient(http2=http2)
+        try:
+            # Warm two pooled connections so one stays idle during the in-flight call
+            await asyncio.gather(*(first._view(pc.FN.NETWORK_STATS, [], []) for _ in range(2)))
+            in_flight = asyncio.create_task(second._view(pc.FN.NETWORK_STATS, [], []))
+            await asyncio.sleep(0.01)
+            if http2:
+                transport = pc.get_http2_client()
+                await first.aclose()
+                assert pc.get_http2_client() is transport and not transport.is_closed
+            else:
+                pool = pc.get_pool()
+                idle = list(pool._idle)
+                await first.aclose()
+                assert idle and pc.get_pool() is pool and not any(s.closed for s in idle)
+            return await in_flight, await second._view(pc.FN.NETWORK_STATS, [], [])
+        finally:
+            await pc.aclose_transports()
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == (["1"], ["1"])
+
+
+def _stub_views(client, responses, log=None):
+    """Replace ``client._view`` with a lookup in ``responses`` keyed by function"""
+    async def view(function, type_arguments, arguments):
+        if log is not None:
+            log.append((function, arguments))
+        await asyncio.sleep(0)
+        response = responses[function]
+        if isinstance(response, Exception):
+            raise response
+        return response(arguments) if callable(response) else response
+    client._view = view
+
+
+def test_batch_runs_dependents_in_a_later_layer():
+    client = pc.ModernTensorClient()
+    log = []
+    _stub_views(client, {"uids": [["1", "2"]], "stats": ["3"], "info": lambda a: [a[0]]}, log)
+
+    results = asyncio.run(client.batch([
+        pc.BatchCall("uids", []),
+        pc.BatchCall("info", lambda r: [r[0][1]], input_from=0),
+        pc.BatchCall("stats", []),
+    ]))
+
+    assert results == [[["1", "2"]], ["2"], ["3"]]
+    assert [f for f, _ in log] == ["uids", "stats", "info"]
+
+
+def test_batch_fan_out_calls_view_once_per_argument_list():
+    client = pc.ModernTensorClient()
+    _stub_views(client, {"uids": [["1", "2", "3"]], "info": lambda a: [{"subnet_uid": a[0]}]})
+
+    _, infos = asyncio.run(client.batch([
+        pc.BatchCall("uids", []),
+        pc.BatchCall("info", lambda r: [[uid] for uid in r[0]], input_from=0, fan_out=True),
+    ]))
+
+    assert infos == [[{"subnet_uid": "1"}], [{"subnet_uid": "2"}], [{"subnet_uid": "3"}]]
+
+
+def test_batch_marks_dependents_of_failed_call_invalid_argument():
+    client = pc.ModernTensorClient()
+    log = []
+    failure = pc.ApiError("boom", 500)
+    _stub_views(client, {"uids": failure, "info": ["unused"], "stats": ["1"]}, log)
+
+    results = asyncio.run(client.batch([
+        pc.BatchCall("uids", []),
+        pc.BatchCall("info", lambda r: [r[0][0]], input_from=0),
+        pc.BatchCall("info", lambda r: [r[0]], input_from=1),
+        pc.BatchCall("stats", []),
+    ]))
+
+    assert results[0] is failure
+    assert isinstance(results[1], ValueError) and "INVALID_ARGUMENT" in str(results[1])
+    assert isinstance(results[2], ValueError) and "INVALID_ARGUMENT" in str(results[2])
+    assert results[3] == ["1"]
+    assert "info" not in [f for f, _ in log]
+
+
+def test_batch_rejects_forward_input_from():
+    client = pc.ModernTensorClient()
+    with pytest.raises(ValueError):
+        asyncio.run(client.batch([pc.BatchCall("info", lambda r: r, input_from=0)]))
+
+
+@pytest.mark.parametrize("call", [
+    pc.BatchCall("info", ["1"], input_from=0),
+    pc.BatchCall("info", lambda r: r),
+])
+def test_batch_rejects_arguments_not_matching_input_from(call):
+    client = pc.ModernTensorClient()
+    _stub_views(client, {"uids": [["1"]], "info": ["unused"]})
+    with pytest.raises(ValueError, match="Batch call 1"):
+        asyncio.run(client.batch([pc.BatchCall("uids", []), call]))
+
+
+class _FakeNode:
+    """Stub for ``ModernTensorClient._request`` tracking on-chain sequence numbers"""
+
+    def __init__(self, sequence_number=5, reject=None, resync_to=None, expires_in=600):
+        self.sequence_number = sequence_number
+        self.expires_in = expires_in
+        self.reject = list(reject or [])
+        self.resync_to = resync_to
+        self.requests = []
+        self.submitted = []
+
+    async def __call__(self, method, path, **kwargs):
+        self.requests.append((method, path))
+        if path == "/v1":
+            return {"chain_id": "2"}
+        if path.startswith("/v1/accounts/"):
+            return {"sequence_number": str(self.sequence_number)}
+        if path.startswith("/v1/transactions/by_hash/"):
+            if self.expires_in is None:
+                raise pc.ApiError("transaction not found", 404)
+            expiration = int(time.time()) + self.expires_in
+            return {"type": "pending_transaction", "expiration_timestamp_secs": str(expiration)}
+        # Signed BCS txn: 32-byte sender address, then the u64 sequence number
+        sequence_number = int.from_bytes(kwargs["data"][32:40], "little")
+        if self.reject:
+            if self.resync_to is not None:
+                self.sequence_number = self.resync_to
+            raise pc.ApiError(f'{{"vm_error_code": "{self.reject.pop(0)}"}}', 400)
+        self.submitted.append(sequence_number)
+        return {"hash": f"0x{sequence_number}"}
+
+    def lookups(self, path_prefix):
+        return sum(1 for _, path in self.requests if path.startswith(path_prefix))
+
+
+def _client_with_node(node):
+    client = pc.ModernTensorClient()
+    client._request = node
+    return client
+
+
+def test_submit_reserves_sequence_numbers_locally():
+    node = _FakeNode(sequence_number=5)
+    client = _client_with_node(node)
+
+    async def run():
+        await client._submit_purchase_validator_permit(1)
+        await client._submit_purchase_validator_permit(2)
+        await client._submit_all(
+            client._submit_purchase_validator_permit, [{"subnet_id": 3}, {"subnet_id": 4}]
+        )
+
+    client.confirm_many = lambda hashes: asyncio.sleep(0)
+    asyncio.run(run())
+
+    assert node.submitted == [5, 6, 7, 8]
+    assert node.lookups("/v1/accounts/") == 1
+    assert node.lookups("/v1") - node.lookups("/v1/") == 1
+
+
+@pytest.mark.parametrize("code", ["SEQUENCE_NUMBER_TOO_OLD", "SEQUENCE_NUMBER_TOO_NEW"])
+def test_submit_resyncs_once_on_out_of_sync_sequence(code):
+    node = _FakeNode(sequence_number=5, reject=[code], resync_to=7)
+    client = _client_with_node(node)
+
+    async def run():
+        await client._submit_purchase_validator_permit(1)
+        await client._submit_purchase_validator_permit(1)
+
+    asyncio.run(run())
+
+    assert node.submitted == [7, 8]
+    assert node.lookups("/v1/accounts/") == 2
+
+
+def test_submit_gives_up_after_one_resync():
+    node = _FakeNode(reject=["SEQUENCE_NUMBER_TOO_OLD", "SEQUENCE_NUMBER_TOO_OLD"])
+    client = _client_with_node(node)
+
+    with pytest.raises(pc.ApiError):
+        asyncio.run(client._submit_purchase_validator_permit(1))
+    assert client._seq is None
+
+
+def _submit_and_time_out(node):
+    """Submit twice around a confirmation timeout, returning the client"""
+    client = _client_with_node(node)
+
+    async def run():
+        tx_hash = await client._submit_purchase_validator_permit(1)
+        with pytest.raises(TimeoutError):
+            await client.wait_for_tx(tx_hash, initial=0.01, max_backoff=0.01, timeout=0.05)
+        await client._submit_purchase_validator_permit(1)
+
+    asyncio.run(run())
+    return client
+
+
+def test_confirmation_timeout_keeps_counter_while_tx_is_pending():
+    node = _FakeNode(sequence_number=5)
+    client = _submit_and_time_out(node)
+
+    # The pending tx still holds sequence number 5
+    assert node.submitted == [5, 6]
+    assert node.lookups("/v1/accounts/") == 1
+    assert client._seq == 7
+
+
+@pytest.mark.parametrize("expires_in", [-1, None], ids=["expired", "missing"])
+def test_confirmation_timeout_resyncs_counter_for_dropped_tx(expires_in):
+    node = _FakeNode(sequence_number=5, expires_in=expires_in)
+    client = _submit_and_time_out(node)
+
+    # The dropped tx never consumed sequence number 5
+    assert node.submitted == [5, 5]
+    assert client._seq == 6
+
+
+def test_register_miner_prints_bytes_uid_as_text(capsys):
+    client = _client_with_node(_FakeNode())
+
+    asyncio.run(client.register_miner(
+        b"quick_miner_1", 1, 10, b"hash", b"http://miner", confirm=False
+    ))
+
+    out = capsys.readouterr().out
+    assert "Miner quick_miner_1 registration submitted" in out
+    assert "b'" not in out